@@ -4,11 +4,9 @@
 import jax
 import numpy as np
 import jax.numpy as jnp
-import jaxlib
 from numbers import Number
 from operator import mul
-from functools import reduce
-from jaxlib.xla_extension import Buffer
+from functools import reduce, partial
 from typing import Iterable, Optional, Union, Sequence, Callable
 import multiprocessing as _multiprocessing
 from haiku._src.data_structures import FlatMapping
@@ -16,7 +14,14 @@ from haiku._src.data_structures import FlatMapping
 # local
 import ivy
 from ivy.functional.backends.jax.device import _to_device, _to_array
-from ivy.functional.backends.jax import JaxArray
+from ivy.functional.backends.jax import JaxArray, NativeArray
+
+# noinspection PyUnresolvedReferences
+_native_array_types = NativeArray + (
+    jax.interpreters.ad.JVPTracer,
+    jax.core.ShapedArray,
+    jax.interpreters.partial_eval.DynamicJaxprTracer,
+)
 
 
 def container_types():
@@ -28,26 +33,7 @@ def current_backend_str() -> str:
 
 
 def is_native_array(x, /, *, exclusive=False):
-    if exclusive:
-        return isinstance(
-            x,
-            (
-                jax.interpreters.xla._DeviceArray,
-                jaxlib.xla_extension.DeviceArray,
-                Buffer,
-            ),
-        )
-    return isinstance(
-        x,
-        (
-            jax.interpreters.xla._DeviceArray,
-            jaxlib.xla_extension.DeviceArray,
-            Buffer,
-            jax.interpreters.ad.JVPTracer,
-            jax.core.ShapedArray,
-            jax.interpreters.partial_eval.DynamicJaxprTracer,
-        ),
-    )
+    return isinstance(x, NativeArray if exclusive else _native_array_types)
 
 
 def get_item(x: JaxArray, query: JaxArray) -> JaxArray:
@@ -59,10 +45,8 @@ def array_equal(x0: JaxArray, x1: JaxArray, /) -> bool:
 
 
 def to_numpy(x: JaxArray, /, *, copy: bool = True) -> np.ndarray:
-    if copy:
-        return np.array(_to_array(x))
-    else:
-        return np.asarray(_to_array(x))
+    x = np.asarray(_to_array(x))
+    return x.copy() if copy else x
 
 
 def to_scalar(x: JaxArray, /) -> Number:
@@ -76,6 +60,17 @@ def to_list(x: JaxArray, /) -> list:
     return _to_array(x).tolist()
 
 
+@partial(jax.jit, static_argnames=("axis", "batch_dims"))
+def _gather_batched(params, indices, *, axis, batch_dims):
+    # flatten the batch dims into one leading axis and map a single take over it
+    batch_shape = params.shape[:batch_dims]
+    batch_size = reduce(mul, batch_shape, 1)
+    params = jnp.reshape(params, (batch_size, *params.shape[batch_dims:]))
+    indices = jnp.reshape(indices, (batch_size, *indices.shape[batch_dims:]))
+    result = jax.vmap(lambda p, i: jnp.take(p, i, axis - batch_dims))(params, indices)
+    return jnp.reshape(result, (*batch_shape, *result.shape[1:]))
+
+
 def gather(
     params: JaxArray,
     indices: JaxArray,
@@ -85,58 +80,45 @@ def gather(
     batch_dims: Optional[int] = 0,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    result = []
     if batch_dims == 0:
         result = jnp.take(params, indices, axis)
     else:
-        for b in range(batch_dims):
-            if b == 0:
-                zip_list = [(p, i) for p, i in zip(params, indices)]
-            else:
-                zip_list = [
-                    (p, i) for z in [zip(p1, i1) for p1, i1 in zip_list] for p, i in z
-                ]
-        for z in zip_list:
-            p, i = z
-            r = jnp.take(p, i, axis - batch_dims)
-            result.append(r)
-        result = jnp.array(result)
-        result = result.reshape([*params.shape[0:batch_dims], *result.shape[1:]])
+        result = _gather_batched(params, indices, axis=axis, batch_dims=batch_dims)
     return _to_device(result)
 
 
+def _index_dtype(shape):
+    # int32 indices halve the index bytes moved, unless a dim is too large for them
+    if max(shape, default=0) > np.iinfo(np.int32).max:
+        return jnp.int64
+    return jnp.int32
+
+
 def gather_nd(
     params: JaxArray, indices: JaxArray, /, *, out: Optional[JaxArray] = None
 ) -> JaxArray:
     indices_shape = indices.shape
     params_shape = params.shape
     num_index_dims = indices_shape[-1]
-    res_dim_sizes_list = [
-        reduce(mul, params_shape[i + 1 :], 1) for i in range(len(params_shape) - 1)
-    ] + [1]
-    result_dim_sizes = jnp.array(res_dim_sizes_list)
-    implicit_indices_factor = int(result_dim_sizes[num_index_dims - 1].item())
-    flat_params = jnp.reshape(params, (-1,))
-    new_shape = [1] * (len(indices_shape) - 1) + [num_index_dims]
-    indices_scales = jnp.reshape(result_dim_sizes[0:num_index_dims], new_shape)
-    indices_for_flat_tiled = jnp.tile(
-        jnp.reshape(jnp.sum(indices * indices_scales, -1, keepdims=True), (-1, 1)),
-        (1, implicit_indices_factor),
-    )
-    implicit_indices = jnp.tile(
-        jnp.expand_dims(jnp.arange(implicit_indices_factor), 0),
-        (indices_for_flat_tiled.shape[0], 1),
+    batch_rank = len(indices_shape) - 1
+    dnums = jax.lax.GatherDimensionNumbers(
+        offset_dims=tuple(
+            range(batch_rank, batch_rank + len(params_shape) - num_index_dims)
+        ),
+        collapsed_slice_dims=tuple(range(num_index_dims)),
+        start_index_map=tuple(range(num_index_dims)),
     )
-    indices_for_flat = indices_for_flat_tiled + implicit_indices
-    flat_indices_for_flat = jnp.reshape(indices_for_flat, (-1,)).astype(jnp.int32)
-    flat_gather = jnp.take(flat_params, flat_indices_for_flat, 0)
-    new_shape = list(indices_shape[:-1]) + list(params_shape[num_index_dims:])
-    ret = jnp.reshape(flat_gather, new_shape)
+    slice_sizes = (1,) * num_index_dims + tuple(params_shape[num_index_dims:])
+    indices = indices.astype(_index_dtype(params_shape))
+    # wrap negative indices as jnp.take would, lax.gather clips or fills them
+    dims = jnp.asarray(params_shape[:num_index_dims], dtype=indices.dtype)
+    indices = jnp.where(indices < 0, indices + dims, indices)
+    ret = jax.lax.gather(params, indices, dnums, slice_sizes)
     return _to_device(ret)
 
 
 def get_num_dims(x: JaxArray, /, *, as_array: bool = False) -> Union[JaxArray, int]:
-    return jnp.asarray(len(jnp.shape(x))) if as_array else len(x.shape)
+    return jnp.asarray(x.ndim) if as_array else x.ndim
 
 
 def inplace_arrays_supported():
@@ -197,6 +179,107 @@ def multiprocessing(context=None):
     )
 
 
+_scatter_reductions = ("sum", "replace", "min", "max")
+
+
+def _scatter_sentinel(reduction, dtype):
+    # identity of the min/max reduction, marking entries no update touched
+    if jnp.issubdtype(dtype, jnp.bool_) or jnp.issubdtype(dtype, jnp.complexfloating):
+        raise ivy.exceptions.IvyException(
+            'reduction "{}" is not supported for updates of dtype {}'.format(
+                reduction, jnp.dtype(dtype)
+            )
+        )
+    if jnp.issubdtype(dtype, jnp.floating):
+        info = jnp.finfo(dtype)
+    else:
+        info = jnp.iinfo(dtype)
+    return jnp.array(info.max if reduction == "min" else info.min, dtype=dtype)
+
+
+def _scatter(target, indices, updates, reduction, target_given):
+    if reduction == "sum":
+        target = target.at[indices].add(updates)
+    elif reduction == "replace":
+        target = target.at[indices].set(updates)
+    elif reduction == "min":
+        target = target.at[indices].min(updates)
+    elif reduction == "max":
+        target = target.at[indices].max(updates)
+    if reduction in ["min", "max"] and not target_given:
+        sentinel = _scatter_sentinel(reduction, updates.dtype)
+        target = jnp.where(target == sentinel, jnp.zeros((), updates.dtype), target)
+    return target
+
+
+def _scatter_init(shape, reduction, dtype):
+    if reduction in ["min", "max"]:
+        return jnp.full(shape, _scatter_sentinel(reduction, dtype), dtype=dtype)
+    return jnp.zeros(shape, dtype=dtype)
+
+
+def _scatter_nd_inputs(indices, updates, shape):
+    # broadcast indices and updates against each other here, inside the jitted
+    # scatter, so the broadcast fuses with the reshape consuming it
+    indices = indices.astype(_index_dtype(shape))
+    num_index_dims = indices.shape[-1]
+    slice_shape = tuple(shape[num_index_dims:])
+    target_shape = jnp.broadcast_shapes(updates.shape, indices.shape[:-1] + slice_shape)
+    if updates.shape != target_shape:
+        updates = jnp.broadcast_to(updates, target_shape)
+    batch_shape = target_shape[: len(target_shape) - len(slice_shape)]
+    if indices.shape[:-1] != batch_shape:
+        indices = jnp.broadcast_to(indices, batch_shape + indices.shape[-1:])
+    if indices.ndim != 2:
+        indices = indices.reshape(-1, num_index_dims)
+    updates = updates.reshape((indices.shape[0],) + slice_shape)
+    return indices, updates
+
+
+def _scatter_nd(target, indices, updates, reduction, target_given):
+    num_index_dims = indices.shape[-1]
+    if reduction == "sum":
+        # wrap negative indices as .at[] would, lax.scatter_add drops them
+        dims = jnp.asarray(target.shape[:num_index_dims], dtype=indices.dtype)
+        indices = jnp.where(indices < 0, indices + dims, indices)
+        dnums = jax.lax.ScatterDimensionNumbers(
+            update_window_dims=tuple(range(1, updates.ndim)),
+            inserted_window_dims=tuple(range(num_index_dims)),
+            scatter_dims_to_operand_dims=tuple(range(num_index_dims)),
+        )
+        return jax.lax.scatter_add(target, indices, updates, dnums)
+    # column slices fuse into the scatter, unlike transposing the indices first
+    indices_tuple = tuple(indices[:, i] for i in range(num_index_dims)) + (Ellipsis,)
+    return _scatter(target, indices_tuple, updates, reduction, target_given)
+
+
+# the *_new variants build the initial target inside the jitted function so
+# XLA can fuse the fill into the scatter rather than writing the output twice,
+# while the *_into variants take a given target, which must be a native array
+@partial(jax.jit, static_argnames=("reduction",))
+def _scatter_flat_into(target, indices, updates, *, reduction):
+    return _scatter(target, indices, updates, reduction, True)
+
+
+@partial(jax.jit, static_argnames=("size", "reduction"))
+def _scatter_flat_new(indices, updates, *, size, reduction):
+    target = _scatter_init((size,), reduction, updates.dtype)
+    return _scatter(target, indices, updates, reduction, False)
+
+
+@partial(jax.jit, static_argnames=("reduction",))
+def _scatter_nd_into(target, indices, updates, *, reduction):
+    indices, updates = _scatter_nd_inputs(indices, updates, target.shape)
+    return _scatter_nd(target, indices, updates, reduction, True)
+
+
+@partial(jax.jit, static_argnames=("shape", "reduction"))
+def _scatter_nd_new(indices, updates, *, shape, reduction):
+    indices, updates = _scatter_nd_inputs(indices, updates, shape)
+    target = _scatter_init(shape, reduction, updates.dtype)
+    return _scatter_nd(target, indices, updates, reduction, False)
+
+
 def scatter_flat(
     indices: JaxArray,
     updates: JaxArray,
@@ -206,37 +289,25 @@ def scatter_flat(
     reduction: str = "sum",
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    target = out
+    target = out.data if ivy.is_ivy_array(out) else out
     target_given = ivy.exists(target)
     if ivy.exists(size) and ivy.exists(target):
         ivy.assertions.check_equal(len(target.shape), 1)
         ivy.assertions.check_equal(target.shape[0], size)
-    if reduction == "sum":
-        if not target_given:
-            target = jnp.zeros([size], dtype=updates.dtype)
-        target = target.at[indices].add(updates)
-    elif reduction == "replace":
-        if not target_given:
-            target = jnp.zeros([size], dtype=updates.dtype)
-        target = target.at[indices].set(updates)
-    elif reduction == "min":
-        if not target_given:
-            target = jnp.ones([size], dtype=updates.dtype) * 1e12
-        target = target.at[indices].min(updates)
-        if not target_given:
-            target = jnp.where(target == 1e12, 0.0, target)
-    elif reduction == "max":
-        if not target_given:
-            target = jnp.ones([size], dtype=updates.dtype) * -1e12
-        target = target.at[indices].max(updates)
-        if not target_given:
-            target = jnp.where(target == -1e12, 0.0, target)
-    else:
+    if reduction not in _scatter_reductions:
         raise ivy.exceptions.IvyException(
             'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
                 reduction
             )
         )
+    indices = jnp.asarray(indices)
+    updates = jnp.asarray(updates)
+    if target_given:
+        target = _scatter_flat_into(target, indices, updates, reduction=reduction)
+    else:
+        target = _scatter_flat_new(
+            indices, updates, size=int(size), reduction=reduction
+        )
     return _to_device(target)
 
 
@@ -255,73 +326,44 @@ def scatter_nd(
         isinstance(indices, Iterable) and Ellipsis in indices
     ):
         indices = [[indices]] if isinstance(indices, Number) else indices
-        indices = jnp.array(indices)
+        indices = jnp.asarray(indices)
         if len(indices.shape) < 2:
             indices = jnp.expand_dims(indices, 0)
     # keep below commented out, array API tests are passing without this
     # updates = [updates] if isinstance(updates, Number) else updates
 
-    updates = jnp.array(
+    updates = jnp.asarray(
         updates,
         dtype=ivy.dtype(out, as_native=True)
         if ivy.exists(out)
         else ivy.default_dtype(item=updates),
     )
 
-    # handle Ellipsis
-    if isinstance(indices, tuple) or indices is Ellipsis:
-        indices_tuple = indices
-    else:
-        expected_shape = (
-            indices.shape[:-1] + out.shape[indices.shape[-1] :]
-            if ivy.exists(out)
-            else indices.shape[:-1] + tuple(shape[indices.shape[-1] :])
-        )
-        if sum(updates.shape) < sum(expected_shape):
-            updates = ivy.broadcast_to(updates, expected_shape)._data
-        elif sum(updates.shape) > sum(expected_shape):
-            indices = ivy.broadcast_to(
-                indices, updates.shape[:1] + (indices.shape[-1],)
-            )._data
-        indices_flat = indices.reshape(-1, indices.shape[-1]).T
-        indices_tuple = tuple(indices_flat) + (Ellipsis,)
-
-    # implementation
-    target = out
+    # implementation, unwrapping out since ivy.scatter_nd passes it as an ivy.Array
+    # and only native arrays can be passed to the jitted scatter
+    target = out.data if ivy.is_ivy_array(out) else out
     target_given = ivy.exists(target)
     if ivy.exists(shape) and ivy.exists(target):
         ivy.assertions.check_equal(ivy.Shape(target.shape), ivy.Shape(shape))
     shape = list(shape) if ivy.exists(shape) else list(out.shape)
-    if reduction == "sum":
-        if not target_given:
-            target = jnp.zeros(shape, dtype=updates.dtype)
-        target = target.at[indices_tuple].add(updates)
-    elif reduction == "replace":
-        if not target_given:
-            target = jnp.zeros(shape, dtype=updates.dtype)
-        target = target.at[indices_tuple].set(updates)
-    elif reduction == "min":
-        if not target_given:
-            target = jnp.ones(shape, dtype=updates.dtype) * 1e12
-        target = target.at[indices_tuple].min(updates)
-        if not target_given:
-            target = jnp.asarray(
-                jnp.where(target == 1e12, 0.0, target), dtype=updates.dtype
-            )
-    elif reduction == "max":
-        if not target_given:
-            target = jnp.ones(shape, dtype=updates.dtype) * -1e12
-        target = target.at[indices_tuple].max(updates)
-        if not target_given:
-            target = jnp.asarray(
-                jnp.where(target == -1e12, 0.0, target), dtype=updates.dtype
-            )
-    else:
+    if reduction not in _scatter_reductions:
         raise ivy.exceptions.IvyException(
             'reduction is {}, but it must be one of "sum", "min" or "max"'.format(
                 reduction
             )
         )
+    # handle Ellipsis
+    if isinstance(indices, tuple) or indices is Ellipsis:
+        if not target_given:
+            target = _scatter_init(shape, reduction, updates.dtype)
+        target = _scatter(target, indices, updates, reduction, target_given)
+    elif target_given:
+        target = _scatter_nd_into(target, indices, updates, reduction=reduction)
+    else:
+        # static jit arguments must be hashable, so shape arrays become ints
+        target = _scatter_nd_new(
+            indices, updates, shape=tuple(int(s) for s in shape), reduction=reduction
+        )
     if ivy.exists(out):
         return ivy.inplace_update(out, _to_device(target))
     return _to_device(target)
@@ -345,3 +387,96 @@ def vmap(
     return ivy.to_native_arrays_and_back(
         jax.vmap(func, in_axes=in_axes, out_axes=out_axes)
     )
+
+
+# jax-only map transformations, reachable through the jax backend module since the
+# other backends have no multi-device or sequential-batched map to dispatch to
+
+
+def pmap(
+    func: Callable,
+    in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
+    out_axes: Optional[int] = 0,
+    axis_name: Optional[str] = None,
+) -> Callable:
+    """Parallel map. Creates a function which maps func over argument axes, running
+    each slice of the mapped axis on a separate local device.
+
+    Parameters
+    ----------
+    func
+        Function to be mapped over additional axes.
+    in_axes
+        An integer, None, or sequence thereof specifying which input array axes to
+        map over, as for :func:`vmap`. The mapped axis size must not exceed the
+        number of local devices.
+    out_axes
+        An integer indicating where the mapped axis should appear in the output.
+    axis_name
+        Optional name for the mapped axis, for use with collective operations.
+
+    Returns
+    -------
+    ret
+        Parallelized version of func.
+    """
+    return ivy.to_native_arrays_and_back(
+        jax.pmap(func, axis_name=axis_name, in_axes=in_axes, out_axes=out_axes)
+    )
+
+
+def lax_map(func: Callable, batch_size: Optional[int] = None) -> Callable:
+    """Sequential map. Creates a function which applies func to each slice of the
+    leading axis of its input in turn, keeping the memory of only one slice (or one
+    batch of slices) live at a time.
+
+    Parameters
+    ----------
+    func
+        Function to be mapped over the leading axis of its single argument, which
+        may be an array or a pytree of arrays with a shared leading dimension.
+    batch_size
+        If given, slices are processed batch_size at a time with func vectorized
+        over each batch, trading memory for speed. A final partial batch is handled
+        separately.
+
+    Returns
+    -------
+    ret
+        Mapped version of func, stacking the per-slice results along axis 0.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ivy.exceptions.IvyException(
+            "batch_size is {}, but it must be at least 1".format(batch_size)
+        )
+
+    def _lax_map(xs):
+        if batch_size is None:
+            return jax.lax.map(func, xs)
+        # jax.lax.map only takes batch_size in newer jax, so batch manually
+        leaves = jax.tree_util.tree_leaves(xs)
+        num_batches, remainder = divmod(leaves[0].shape[0], batch_size)
+        batched_func = jax.vmap(func)
+        if num_batches == 0:
+            return batched_func(xs)
+        num_batched = num_batches * batch_size
+        ret = jax.lax.map(
+            batched_func,
+            jax.tree_util.tree_map(
+                lambda x: x[:num_batched].reshape(
+                    (num_batches, batch_size) + x.shape[1:]
+                ),
+                xs,
+            ),
+        )
+        ret = jax.tree_util.tree_map(
+            lambda y: y.reshape((num_batched,) + y.shape[2:]), ret
+        )
+        if remainder:
+            rest = batched_func(jax.tree_util.tree_map(lambda x: x[num_batched:], xs))
+            ret = jax.tree_util.tree_map(
+                lambda y, r: jnp.concatenate([y, r]), ret, rest
+            )
+        return ret
+
+    return ivy.to_native_arrays_and_back(_lax_map)
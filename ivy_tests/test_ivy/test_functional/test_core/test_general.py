@@ -2,6 +2,7 @@
 
 # global
 import time
+import jax
 import jax.numpy as jnp
 import pytest
 from hypothesis import given, assume, strategies as st
@@ -677,6 +678,67 @@ def test_scatter_nd(
     )
 
 
+# the jax backend jits scatter_nd, so an ivy.Array out must be unwrapped first
+def test_jax_scatter_nd_ivy_array_out():
+    ivy.set_backend("jax")
+    out = ivy.array([1.0, 2.0, 3.0, 4.0])
+    ret = ivy.scatter_nd(
+        ivy.array([[1], [3]]), ivy.array([5.0, 6.0]), reduction="replace", out=out
+    )
+    ret, out = ivy.to_numpy(ret), ivy.to_numpy(out)
+    ivy.unset_backend()
+    assert np.allclose(ret, [1.0, 5.0, 3.0, 6.0])
+    assert np.allclose(out, [1.0, 5.0, 3.0, 6.0])
+
+
+def test_jax_array_setitem_via_scatter_nd():
+    ivy.set_backend("jax")
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]])
+    x[0] = ivy.array([5.0, 6.0])
+    x[1] = 7.0
+    x = ivy.to_numpy(x)
+    ivy.unset_backend()
+    assert np.allclose(x, [[5.0, 6.0], [7.0, 7.0]])
+
+
+# min/max scatters seed untouched entries with the dtype's limits, which must
+# neither promote the dtype nor leak into the result
+@pytest.mark.parametrize("dtype", ["int8", "int32", "float16", "float32"])
+@pytest.mark.parametrize("reduction", ["min", "max"])
+def test_jax_scatter_min_max_dtypes(dtype, reduction):
+    updates = np.array([5, 2, -3], dtype=dtype)
+    expected = np.array([2 if reduction == "min" else 5, 0, -3, 0], dtype=dtype)
+    ivy.set_backend("jax")
+    flat = ivy.scatter_flat(
+        ivy.array([0, 0, 2]), ivy.array(updates), size=4, reduction=reduction
+    )
+    nd = ivy.scatter_nd(
+        ivy.array([[0], [0], [2]]), ivy.array(updates), [4], reduction=reduction
+    )
+    flat_dtype, nd_dtype = ivy.dtype(flat), ivy.dtype(nd)
+    flat, nd = ivy.to_numpy(flat), ivy.to_numpy(nd)
+    ivy.unset_backend()
+    assert flat_dtype == dtype
+    assert nd_dtype == dtype
+    assert np.array_equal(flat, expected)
+    assert np.array_equal(nd, expected)
+
+
+@pytest.mark.parametrize("dtype", ["bool", "complex64"])
+def test_jax_scatter_min_max_unsupported_dtypes(dtype):
+    ivy.set_backend("jax")
+    try:
+        with pytest.raises(ivy.exceptions.IvyException):
+            ivy.scatter_flat(
+                ivy.array([0, 1]),
+                ivy.array(np.ones(2, dtype=dtype)),
+                size=2,
+                reduction="min",
+            )
+    finally:
+        ivy.unset_backend()
+
+
 # gather
 @handle_cmd_line_args
 @given(
@@ -831,6 +893,16 @@ def test_gather_nd(
     )
 
 
+# the jax backend gathers with lax.gather, which does not wrap negative indices
+@pytest.mark.parametrize("indices", [[[-1]], [[0, -1]], [[-2, 1], [1, -3]]])
+def test_jax_gather_nd_negative_indices(indices):
+    params = np.arange(6, dtype=np.float32).reshape((2, 3))
+    ivy.set_backend("jax")
+    ret = ivy.to_numpy(ivy.gather_nd(ivy.array(params), ivy.array(indices)))
+    ivy.unset_backend()
+    assert np.allclose(ret, np.array([params[tuple(index)] for index in indices]))
+
+
 # exists
 @handle_cmd_line_args
 @given(
@@ -2008,3 +2080,38 @@ def test_vmap(func, arrays_and_axes, in_axes_as_cont):
         pass
     else:
         assert False, "One of the results is None while other isn't"
+
+
+# pmap and lax_map only exist in the jax backend
+@given(num_cols=st.integers(min_value=1, max_value=5))
+def test_jax_pmap(num_cols):
+    ivy.set_backend("jax")
+    num_devices = jax.local_device_count()
+    x = np.arange(num_devices * num_cols, dtype=np.float32).reshape(
+        (num_devices, num_cols)
+    )
+    pmapped_func = ivy.functional.backends.jax.pmap(lambda a: jnp.sum(a) * a)
+    ret = np.asarray(pmapped_func(jnp.asarray(x)).data)
+    ivy.unset_backend()
+    assert np.allclose(ret, np.sum(x, axis=1, keepdims=True) * x)
+
+
+@given(
+    num_slices=st.integers(min_value=1, max_value=10),
+    batch_size=st.one_of(st.none(), st.integers(min_value=1, max_value=4)),
+)
+def test_jax_lax_map(num_slices, batch_size):
+    ivy.set_backend("jax")
+    x = np.arange(num_slices * 3, dtype=np.float32).reshape((num_slices, 3))
+    mapped_func = ivy.functional.backends.jax.lax_map(
+        lambda a: jnp.sum(a) * a, batch_size=batch_size
+    )
+    ret = np.asarray(mapped_func(jnp.asarray(x)).data)
+    ivy.unset_backend()
+    assert ret.shape == x.shape
+    assert np.allclose(ret, np.sum(x, axis=1, keepdims=True) * x)
+
+
+def test_jax_lax_map_invalid_batch_size():
+    with pytest.raises(ivy.exceptions.IvyException):
+        ivy.functional.backends.jax.lax_map(lambda a: a, batch_size=0)